@@ -77,16 +77,24 @@ class Clip(object):
 
         c_starts = start_frames - self.aux_context_window
         c_ends = start_frames + self.batch_max_frames + self.aux_context_window
-        y_batch = np.stack(
-            [x[start:end] for x, start, end in zip(xs, x_starts, x_ends)])
-        c_batch = np.stack(
-            [c[start:end] for c, start, end in zip(cs, c_starts, c_ends)])
+
+        # copy the windows into preallocated buffers in the output layout,
+        # so only the clipped part of each (memory-mapped) array is read and
+        # no extra stacking, casting or transposing is needed
+        batch_size = len(xs)
+        y_batch = np.empty(
+            (batch_size, 1, self.batch_max_steps), dtype=np.float32)
+        c_batch = np.empty(
+            (batch_size, cs[0].shape[1],
+             self.batch_max_frames + 2 * self.aux_context_window),
+            dtype=np.float32)
+        for i, (x, c) in enumerate(zip(xs, cs)):
+            y_batch[i, 0] = x[x_starts[i]:x_ends[i]]
+            c_batch[i] = c[c_starts[i]:c_ends[i]].T
 
         # convert each batch to tensor, asuume that each item in batch has the same length
-        y_batch = paddle.to_tensor(
-            y_batch, dtype=paddle.float32).unsqueeze(1)  # (B, 1, T)
-        c_batch = paddle.to_tensor(
-            c_batch, dtype=paddle.float32).transpose([0, 2, 1])  # (B, C, T')
+        y_batch = paddle.to_tensor(y_batch)  # (B, 1, T)
+        c_batch = paddle.to_tensor(c_batch)  # (B, C, T')
 
         return y_batch, c_batch
 
@@ -15,8 +15,11 @@
 import yaml
 from yacs.config import CfgNode as Configuration
 
+# use the libyaml backed loader when it is available
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 with open("conf/default.yaml", 'rt') as f:
-    _C = yaml.safe_load(f)
+    _C = yaml.load(f, Loader=_Loader)
     _C = Configuration(_C)
 
 
@@ -13,9 +13,11 @@
 # limitations under the License.
 
 import logging
+from contextlib import contextmanager
 from typing import Dict
 
 import paddle
+from paddle import DataParallel
 from paddle.nn import Layer
 from paddle.optimizer import Optimizer
 from paddle.optimizer.lr import LRScheduler
@@ -30,7 +32,19 @@ from parakeet.training.trainer import Trainer
 from parakeet.training.reporter import report
 from parakeet.models.parallel_wavegan import PWGGenerator, PWGDiscriminator
 from parakeet.modules.stft_loss import MultiResolutionSTFTLoss
-from parakeet.utils.profile import synchronize
+
+
+@contextmanager
+def no_sync(model: Layer):
+    """Skip gradient allreduce for the backward passes through a
+    DataParallel model within this context. It does nothing for a plain
+    Layer, or with Paddle versions whose DataParallel has no ``no_sync``
+    (before 2.2)."""
+    if isinstance(model, DataParallel) and hasattr(model, "no_sync"):
+        with model.no_sync():
+            yield
+    else:
+        yield
 
 
 class PWGUpdater(StandardUpdater):
@@ -92,7 +106,10 @@ class PWGUpdater(StandardUpdater):
         ## Adversarial loss
         if self.state.iteration > self.discriminator_train_start_steps:
             with timer() as t:
-                p_ = self.discriminator(wav_)
+                # gradients of the discriminator computed here are cleared
+                # before its own update, so there is no need to sync them
+                with no_sync(self.discriminator):
+                    p_ = self.discriminator(wav_)
                 adv_loss = self.criterion_mse(p_, paddle.ones_like(p_))
                 logging.debug(
                     f"Discriminator and adversarial loss takes {t.elapse}s")
@@ -113,10 +130,11 @@ class PWGUpdater(StandardUpdater):
 
         # Disctiminator
         if self.state.iteration > self.discriminator_train_start_steps:
+            # wav_ is produced without gradient, no detach is needed
             with paddle.no_grad():
                 wav_ = self.generator(noise, mel)
             p = self.discriminator(wav)
-            p_ = self.discriminator(wav_.detach())
+            p_ = self.discriminator(wav_)
             real_loss = self.criterion_mse(p, paddle.ones_like(p))
             fake_loss = self.criterion_mse(p_, paddle.zeros_like(p_))
             report("train/real_loss", float(real_loss))
@@ -18,6 +18,7 @@ import logging
 import argparse
 import dataclasses
 from pathlib import Path
+from functools import partial
 
 import yaml
 import jsonlines
@@ -30,6 +31,7 @@ from paddle.io import DataLoader, DistributedBatchSampler
 from paddle.optimizer import Adam  # No RAdaom
 from paddle.optimizer.lr import StepDecay
 from paddle import DataParallel
+from paddle.fluid import profiler
 from visualdl import LogWriter
 
 from parakeet.datasets.data_table import DataTable
@@ -70,14 +72,16 @@ def train_sp(args, config):
     logging.getLogger("DataLoader").disabled = True
 
     # construct dataset for training and validation
+    # arrays are memory-mapped, only the clipped window is read in Clip
+    load_mmap = partial(np.load, mmap_mode='r')
     with jsonlines.open(args.train_metadata, 'r') as reader:
         train_metadata = list(reader)
     train_dataset = DataTable(
         data=train_metadata,
         fields=["wave", "feats"],
         converters={
-            "wave": np.load,
-            "feats": np.load,
+            "wave": load_mmap,
+            "feats": load_mmap,
         }, )
     with jsonlines.open(args.dev_metadata, 'r') as reader:
         dev_metadata = list(reader)
@@ -85,8 +89,8 @@ def train_sp(args, config):
         data=dev_metadata,
         fields=["wave", "feats"],
         converters={
-            "wave": np.load,
-            "feats": np.load,
+            "wave": load_mmap,
+            "feats": load_mmap,
         }, )
 
     # collate function and dataloader
@@ -106,16 +110,22 @@ def train_sp(args, config):
         batch_max_steps=config.batch_max_steps,
         hop_size=config.hop_length,
         aux_context_window=config.generator_params.aux_context_window)
+    # keep workers alive across epochs, batches are already moved to device
+    # asynchronously by the dataloader's buffer reader
     train_dataloader = DataLoader(
         train_dataset,
         batch_sampler=train_sampler,
         collate_fn=train_batch_fn,
-        num_workers=config.num_workers)
+        num_workers=config.num_workers,
+        use_shared_memory=True,
+        persistent_workers=True)
     dev_dataloader = DataLoader(
         dev_dataset,
         batch_sampler=dev_sampler,
         collate_fn=train_batch_fn,
-        num_workers=config.num_workers)
+        num_workers=config.num_workers,
+        use_shared_memory=True,
+        persistent_workers=True)
     print("dataloaders done!")
 
     generator = PWGGenerator(**config["generator_params"])
@@ -188,7 +198,8 @@ def train_sp(args, config):
         lambda_adv=config.lambda_adv, )
     trainer = Trainer(
         updater,
-        stop_trigger=(config.train_max_steps, "iteration"),
+        stop_trigger=(args.max_iter if args.max_iter is not None else
+                      config.train_max_steps, "iteration"),
         out=output_dir, )
 
     trainer.extend(
@@ -202,7 +213,14 @@ def train_sp(args, config):
 
     print(trainer.extensions.keys())
     print("Trainer Done!")
-    trainer.run()
+    if args.profile:
+        # profiling records every op, so it is only enabled on request
+        # each rank writes its own profile
+        profile_path = output_dir / f"profiler.rank{dist.get_rank()}.log"
+        with profiler.profiler('All', 'total', str(profile_path)):
+            trainer.run()
+    else:
+        trainer.run()
 
 
 def main():
@@ -219,6 +237,13 @@ def main():
     parser.add_argument(
         "--nprocs", type=int, default=1, help="number of processes")
     parser.add_argument("--verbose", type=int, default=1, help="verbose")
+    parser.add_argument(
+        "--profile", action="store_true", help="run with paddle profiler")
+    parser.add_argument(
+        "--max-iter",
+        type=int,
+        default=None,
+        help="max iterations to train, overwrites train_max_steps in config")
 
     args = parser.parse_args()
     if args.device == "cpu" and args.nprocs > 1:
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import csv
+
+import pandas as pd
 from paddle.io import Dataset
 from pathlib import Path
 
@@ -23,17 +26,28 @@ class LJSpeechMetaData(Dataset):
         self.root = Path(root).expanduser()
         wav_dir = self.root / "wavs"
         csv_path = self.root / "metadata.csv"
-        records = []
-        speaker_name = "ljspeech"
-        with open(str(csv_path), 'rt', encoding='utf-8') as f:
-            for line in f:
-                filename, _, normalized_text = line.strip().split("|")
-                filename = str(wav_dir / (filename + ".wav"))
-                records.append([filename, normalized_text, speaker_name])
-        self.records = records
+        # transcriptions contain bare quotes and words like "null", so
+        # neither quoting nor NA detection is applied, surrounding
+        # whitespace is stripped as a line-based reader would do
+        df = pd.read_csv(
+            csv_path,
+            sep="|",
+            header=None,
+            names=["id", "text", "normalized_text"],
+            usecols=["id", "normalized_text"],
+            dtype=str,
+            keep_default_na=False,
+            quoting=csv.QUOTE_NONE,
+            encoding="utf-8",
+            engine="c")
+        # fields are kept in parallel lists instead of a list of records
+        ids = df["id"].str.strip()
+        self.filenames = (str(wav_dir) + "/" + ids + ".wav").tolist()
+        self.texts = df["normalized_text"].str.strip().tolist()
+        self.speaker_name = "ljspeech"
 
     def __getitem__(self, i):
-        return self.records[i]
+        return self.filenames[i], self.texts[i], self.speaker_name
 
     def __len__(self):
-        return len(self.records)
+        return len(self.filenames)
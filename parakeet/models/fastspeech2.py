@@ -12,16 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 import paddle
 from paddle import nn
 from paddle.nn import functional as F
 from paddle.nn import initializer as I
 from paddle.fluid.layers import sequence_mask
 
-from parakeet.modules.positioning import position_encoding
+from parakeet.modules.positional_encoding import sinusoid_positional_encoding
 from parakeet.modules.attention import (_split_heads, _concat_heads,
                                         scaled_dot_product_attention)
-from parakeet.modules import geometry as geo
 from parakeet.modules.conv import Conv1dBatchNorm
 
 from typing import Optional
@@ -49,7 +49,8 @@ class FastSpeechFeedForwardTransformer(nn.Layer):
         if input_dim != model_dim:
             self.input_fc = nn.Linear(input_dim, model_dim)
 
-        self.pos_embedding = position_encoding(1 + max_position, model_dim)
+        self.pos_embedding = sinusoid_positional_encoding(0, 1 + max_position,
+                                                          model_dim)
 
         self.num_speakers = num_speakers
         if num_speakers > 1:
@@ -286,14 +287,34 @@ class FastSpeechLengthRegulator(nn.Layer):
 
     def forward(self, x, durations):
         # [B, T, C], [B, T] -> [B, T', C], [B]
-        output_lens = paddle.sum(durations, axis=-1)
-
-        batch_size = x.shape[0]
-        expanded_sequences = []
-        for i in range(batch_size):
-            expanded_sequence = geo.repeat(x[i], durations[i], axis=0)
-            expanded_sequences.append(expanded_sequence)
-        padded_sequence = geo.pad_sequences(expanded_sequences)
+        # build the [B, T'] gather index on the host, the output length is
+        # needed there anyway to allocate the output
+        batch_size, time_steps, channels = x.shape
+        # rounded predicted durations can be -1, they are treated as 0
+        durations_np = np.maximum(durations.numpy(), 0)
+        lens_np = durations_np.sum(-1)
+        max_len = int(lens_np.max())
+        output_lens = paddle.to_tensor(lens_np)
+
+        # each step of the flattened [B * T, C] input is repeated by its
+        # duration, then scattered into its row and column of the output
+        flat_index = np.repeat(
+            np.arange(batch_size * time_steps), durations_np.reshape([-1]))
+        rows = np.repeat(np.arange(batch_size), lens_np)
+        row_starts = np.cumsum(lens_np) - lens_np
+        cols = np.arange(flat_index.size) - np.repeat(row_starts, lens_np)
+
+        # padded output steps point to an extra all-zero row
+        index = np.full(
+            [batch_size, max_len], batch_size * time_steps, dtype=np.int64)
+        index[rows, cols] = flat_index
+
+        x = paddle.reshape(x, [batch_size * time_steps, channels])
+        x = paddle.concat([x, paddle.zeros([1, channels], dtype=x.dtype)])
+        padded_sequence = paddle.gather(
+            x, paddle.to_tensor(index.reshape([-1])))
+        padded_sequence = paddle.reshape(padded_sequence,
+                                         [batch_size, max_len, channels])
         return padded_sequence, output_lens
 
 
@@ -315,7 +336,6 @@ class TacotronPostNet(nn.Layer):
                 hidden_dim if i != num_layers - 1 else input_dim,
                 kernel_size,
                 padding="same",
-                data_format="NLC",
                 momentum=momentum,
                 epsilon=epsilon)
             self.conv_bns.append(convbn)
@@ -324,11 +344,14 @@ class TacotronPostNet(nn.Layer):
     def forward(self, x, mask):
         # [B, T, C], [B, T] -> [B, T, C]
         mask = paddle.unsqueeze(mask, -1)
+        # run the conv stack in NCL layout, with one transpose on each end
+        x = paddle.transpose(x, [0, 2, 1])
         for i, convbn in enumerate(self.conv_bns):
             x = convbn(x)
             if i != self.num_layers - 1:
                 x = paddle.tanh(x)
             x = self.dropout_layer(x)
+        x = paddle.transpose(x, [0, 2, 1])
         x *= mask
         return x
 
@@ -123,8 +123,7 @@ class DecoderPostNet(nn.Layer):
                 d_hidden,
                 kernel_size=kernel_size,
                 padding=padding,
-                bias_attr=I.Uniform(-k, k),
-                data_format='NLC'))
+                bias_attr=I.Uniform(-k, k)))
 
         k = math.sqrt(1.0 / (d_hidden * kernel_size))
         self.conv_batchnorms.extend([
@@ -133,8 +132,7 @@ class DecoderPostNet(nn.Layer):
                 d_hidden,
                 kernel_size=kernel_size,
                 padding=padding,
-                bias_attr=I.Uniform(-k, k),
-                data_format='NLC') for i in range(1, num_layers - 1)
+                bias_attr=I.Uniform(-k, k)) for i in range(1, num_layers - 1)
         ])
 
         self.conv_batchnorms.append(
@@ -143,8 +141,7 @@ class DecoderPostNet(nn.Layer):
                 d_mels,
                 kernel_size=kernel_size,
                 padding=padding,
-                bias_attr=I.Uniform(-k, k),
-                data_format='NLC'))
+                bias_attr=I.Uniform(-k, k)))
 
     def forward(self, x):
         """Calculate forward propagation.
@@ -161,6 +158,8 @@ class DecoderPostNet(nn.Layer):
 
         """
 
+        # run the conv stack in NCL layout, with one transpose on each end
+        x = paddle.transpose(x, [0, 2, 1])
         for i in range(len(self.conv_batchnorms) - 1):
             x = F.dropout(
                 F.tanh(self.conv_batchnorms[i](x)),
@@ -170,6 +169,7 @@ class DecoderPostNet(nn.Layer):
             self.conv_batchnorms[self.num_layers - 1](x),
             self.dropout,
             training=self.training)
+        output = paddle.transpose(output, [0, 2, 1])
         return output
 
 
@@ -206,8 +206,7 @@ class Tacotron2Encoder(nn.Layer):
                 kernel_size,
                 stride=1,
                 padding=int((kernel_size - 1) / 2),
-                bias_attr=I.Uniform(-k, k),
-                data_format='NLC') for i in range(conv_layers)
+                bias_attr=I.Uniform(-k, k)) for i in range(conv_layers)
         ])
         self.p_dropout = p_dropout
 
@@ -232,11 +231,14 @@ class Tacotron2Encoder(nn.Layer):
             Batch of the sequences of padded hidden states.
 
         """
+        # run the conv stack in NCL layout, with one transpose on each end
+        x = paddle.transpose(x, [0, 2, 1])
         for conv_batchnorm in self.conv_batchnorms:
             x = F.dropout(
                 F.relu(conv_batchnorm(x)),
                 self.p_dropout,
                 training=self.training)
+        x = paddle.transpose(x, [0, 2, 1])
 
         output, _ = self.lstm(inputs=x, sequence_length=input_lens)
         return output
@@ -465,9 +465,11 @@ class TransformerTTS(nn.Layer):
         embed = self.encoder_prenet(text)
         if self.toned:
             embed += self.tone_embed(tones)
-        if embed.shape[1] > self.encoder_pe.shape[0]:
-            new_T = max(embed.shape[1], self.encoder_pe.shape[0] * 2)
-            self.encoder_pe = pe.positional_encoding(0, new_T, self.d_encoder)
+        # twice its length if needed
+        if T_enc > self.encoder_pe.shape[0]:
+            new_T = max(T_enc, self.encoder_pe.shape[0] * 2)
+            self.encoder_pe = pe.sinusoid_positional_encoding(0, new_T,
+                                                              self.d_encoder)
         pos_enc = self.encoder_pe[:T_enc, :]  # (T, C)
         x = embed.scale(math.sqrt(
             self.d_encoder)) + pos_enc * self.encoder_pe_scalar
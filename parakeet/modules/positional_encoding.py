@@ -51,10 +51,11 @@ def sinusoid_positional_encoding(start_index, length, size, dtype=None):
         raise ValueError("size should be divisible by 2")
     dtype = dtype or paddle.get_default_dtype()
     channel = np.arange(0, size, 2)
+    inv_freq = 1.0 / (10000**(channel / float(size)))
     index = np.arange(start_index, start_index + length, 1)
-    p = np.expand_dims(index, -1) / (10000**(channel / float(size)))
-    encodings = np.zeros([length, size])
+    p = np.outer(index, inv_freq)
+    encodings = np.empty([length, size])
     encodings[:, 0::2] = np.sin(p)
     encodings[:, 1::2] = np.cos(p)
-    encodings = paddle.to_tensor(encodings)
+    encodings = paddle.to_tensor(encodings, dtype=dtype)
     return encodings
@@ -15,8 +15,9 @@
 import os
 import logging
 from pathlib import Path
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Deque, Dict, Any
 
 import jsonlines
 
@@ -52,7 +53,7 @@ class Snapshot(extension.Extension):
     default_name = "snapshot"
 
     def __init__(self, max_size: int=5, snapshot_on_error: bool=False):
-        self.records: List[Dict[str, Any]] = []
+        self.records: Deque[Dict[str, Any]] = deque()
         self.max_size = max_size
         self._snapshot_on_error = snapshot_on_error
         self._save_all = (max_size == -1)
@@ -66,7 +67,7 @@ class Snapshot(extension.Extension):
         record_path: Path = self.checkpoint_dir / "records.jsonl"
         if record_path.exists():
             logging.debug("Loading from an existing checkpoint dir")
-            self.records = load_records(record_path)
+            self.records = deque(load_records(record_path))
             trainer.updater.load(self.records[-1]['path'])
 
     def on_error(self, trainer, exc, tb):
@@ -100,7 +101,7 @@ class Snapshot(extension.Extension):
         if self.full():
             eariest_record = self.records[0]
             os.remove(eariest_record["path"])
-            self.records.pop(0)
+            self.records.popleft()
 
         # update the record file
         record_path = self.checkpoint_dir / "records.jsonl"
@@ -0,0 +1,53 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import paddle
+
+from parakeet.models.fastspeech2 import FastSpeechLengthRegulator
+
+
+def expand_reference(x, durations):
+    durations = np.maximum(durations, 0)
+    lens = durations.sum(-1)
+    out = np.zeros([x.shape[0], lens.max(), x.shape[-1]], dtype=x.dtype)
+    for i in range(x.shape[0]):
+        expanded = np.repeat(x[i], durations[i], axis=0)
+        out[i, :len(expanded)] = expanded
+    return out, lens
+
+
+def test_length_regulator():
+    regulator = FastSpeechLengthRegulator()
+    x = np.random.randn(3, 5, 4).astype(np.float32)
+    durations_list = [
+        np.array([[1, 0, 2, 3, 0], [0, 0, 0, 0, 0], [2, 1, 1, 0, 4]]),
+        np.array([[1, -1, 2, 3, 0], [-1, 0, 0, 0, 0], [2, 1, 1, -1, 4]]),
+        np.zeros([3, 5], dtype=np.int64),
+    ]
+    for durations in durations_list:
+        for dtype in ["int32", "int64"]:
+            x_tensor = paddle.to_tensor(x, stop_gradient=False)
+            out, lens = regulator(x_tensor,
+                                  paddle.to_tensor(durations.astype(dtype)))
+            ref, ref_lens = expand_reference(x, durations)
+            np.testing.assert_array_equal(out.numpy(), ref)
+            np.testing.assert_array_equal(lens.numpy(), ref_lens)
+
+            # each input step receives the gradient of all its copies
+            out.sum().backward()
+            expected_grad = np.broadcast_to(
+                np.maximum(durations, 0)[:, :, None], x.shape)
+            np.testing.assert_array_equal(x_tensor.grad.numpy(),
+                                          expected_grad)
@@ -0,0 +1,38 @@
+# Copyright (c) 2021 PaddlePaddle Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from parakeet.datasets.ljspeech import LJSpeechMetaData
+
+
+def test_ljspeech_metadata(tmp_path):
+    lines = [
+        'LJ001-0001|Printing, "in the only sense|Printing, "in the only sense',
+        'LJ001-0002|null|null',
+        'LJ001-0003|NA|NA',
+        'LJ001-0004|empty|',
+        'LJ001-0005|trailing|trailing space   ',
+    ]
+    with open(tmp_path / "metadata.csv", 'wt', encoding='utf-8') as f:
+        f.write("\n".join(lines) + "\n")
+
+    dataset = LJSpeechMetaData(tmp_path)
+    assert len(dataset) == 5
+
+    wav_dir = tmp_path / "wavs"
+    assert dataset[0] == (str(wav_dir / "LJ001-0001.wav"),
+                          'Printing, "in the only sense', "ljspeech")
+    assert dataset[1][1] == "null"
+    assert dataset[2][1] == "NA"
+    assert dataset[3][1] == ""
+    assert dataset[4][1] == "trailing space"